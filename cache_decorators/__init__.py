@@ -8,6 +8,7 @@ from importlib.metadata import version
 from ._cache_protocols import (
     FileComparisonDecider,
     FileReadWrite,
+    ReadWriteArrowParquet,
     ReadWriteCSV,
     ReadWriteDelta,
     ReadWriteParquet,
@@ -26,6 +27,7 @@ __all__ = [
     "FileCacher",
     "FileComparisonDecider",
     "FileReadWrite",
+    "ReadWriteArrowParquet",
     "ReadWriteCSV",
     "ReadWriteDelta",
     "ReadWriteParquet",
@@ -1,19 +1,32 @@
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Protocol, TypeVar
 
-import ibis
 from public import public
 
-from ._files import file_past_timeout, t_since_last_mod
+from ._files import file_past_timeout, secs_since_last_mod
 
 if TYPE_CHECKING:
-    from typing import Any
+    from types import ModuleType
+    from typing import Any, ClassVar
 
+    import pyarrow as pa
     from ibis.expr.types import Table
 
-    from ._files import PathTimeDelta
+    from ._files import PathAge
+
+
+ResourceT_contra = TypeVar("ResourceT_contra", contravariant=True)
+
+
+@cache
+def _ibis() -> ModuleType:
+    # ibis pulls in pandas, pyarrow and sqlglot, defer that until a cache is read
+    import ibis  # noqa: PLC0415
+
+    return ibis
 
 
 @public
@@ -23,21 +36,23 @@ class Processor(Protocol):
 
 
 @public
-class UpdateDecider(Protocol):
-    def __call__(self, r_id: str, **kwargs) -> bool: ...
+class UpdateDecider(Protocol[ResourceT_contra]):
+    def __call__(self, resource: ResourceT_contra, /, **kwargs) -> bool: ...
 
 
 @public
-class FileUpdateDecider(Protocol):
+class FileUpdateDecider(UpdateDecider[Path], Protocol):
     def __call__(self, target_resource: Path, **kwargs) -> bool: ...
 
 
 @public
-class FileTimeoutDecider(FileUpdateDecider):
+class FileTimeoutDecider:
+    __slots__ = ("delta_func", "timeout")
+
     def __init__(
         self,
         timeout: int = -1,
-        delta_func: PathTimeDelta = t_since_last_mod,
+        delta_func: PathAge = secs_since_last_mod,
     ) -> None:
         self.timeout = timeout
         self.delta_func = delta_func
@@ -51,33 +66,48 @@ class FileTimeoutDecider(FileUpdateDecider):
 
 
 @public
-class FileComparisonDecider(FileUpdateDecider):
+class FileComparisonDecider:
+    __slots__ = ("input_file_kwd",)
+
     def __init__(self, input_file_kwd: str) -> None:
         self.input_file_kwd = input_file_kwd
 
     def __call__(self, target_resource: Path, **kwargs) -> bool:
-        input_file = Path(kwargs[self.input_file_kwd])
-        return (not target_resource.exists()) or (
-            t_since_last_mod(input_file) < t_since_last_mod(target_resource)
-        )
+        try:
+            input_file = Path(kwargs[self.input_file_kwd])
+        except KeyError:
+            # Defaults are never bound, and with FileCacher(fast_key=True) positional
+            # arguments are not either
+            msg = (
+                f"FileComparisonDecider needs the {self.input_file_kwd!r} argument,"
+                " it was left at its default or, with fast_key, passed positionally"
+            )
+            raise TypeError(msg) from None
+        try:
+            target_mtime = target_resource.stat().st_mtime
+        except FileNotFoundError:
+            return True
+        return input_file.stat().st_mtime > target_mtime
 
 
 @public
 class FileReadWrite(Protocol):
-    @property
-    def file_extension(self) -> str: ...
+    __slots__ = ()
+
+    file_extension: ClassVar[str]
+
     def read_file(self, path: Path) -> Table: ...
     def write_file(self, path: Path, data) -> None: ...  # noqa: ANN001
 
 
 @public
 class ReadWriteParquet(FileReadWrite):
-    @property
-    def file_extension(self) -> str:
-        return ".parquet"
+    __slots__ = ()
+
+    file_extension: ClassVar[str] = ".parquet"
 
     def read_file(self, path: Path) -> Table:
-        return ibis.read_parquet(path)
+        return _ibis().read_parquet(path)
 
     def write_file(self, path: Path, data) -> None:  # noqa: ANN001
         data.to_parquet(path)
@@ -85,12 +115,12 @@ class ReadWriteParquet(FileReadWrite):
 
 @public
 class ReadWriteCSV(FileReadWrite):
-    @property
-    def file_extension(self) -> str:
-        return ".csv"
+    __slots__ = ()
+
+    file_extension: ClassVar[str] = ".csv"
 
     def read_file(self, path: Path) -> Table:
-        return ibis.read_csv(path)
+        return _ibis().read_csv(path)
 
     def write_file(self, path: Path, data) -> None:  # noqa: ANN001
         data.to_csv(path)
@@ -98,12 +128,38 @@ class ReadWriteCSV(FileReadWrite):
 
 @public
 class ReadWriteDelta(FileReadWrite):
-    @property
-    def file_extension(self) -> str:
-        return ".delta"
+    __slots__ = ()
+
+    file_extension: ClassVar[str] = ".delta"
 
     def read_file(self, path: Path) -> Table:
-        return ibis.read_delta(path)
+        return _ibis().read_delta(path)
 
     def write_file(self, path: Path, data) -> None:  # noqa: ANN001
         data.to_delta(path)
+
+
+@public
+class ReadWriteArrowParquet(FileReadWrite):
+    # Reads straight to a pyarrow.Table without going through ibis, so cached calls
+    # and processors get a pyarrow.Table rather than an ibis Table
+    __slots__ = ()
+
+    file_extension: ClassVar[str] = ".parquet"
+
+    def read_file(self, path: Path) -> pa.Table:
+        import pyarrow.dataset as ds  # noqa: PLC0415
+
+        return ds.dataset(path, format="parquet").to_table()
+
+    def write_file(self, path: Path, data) -> None:  # noqa: ANN001
+        import pyarrow as pa  # noqa: PLC0415
+        import pyarrow.parquet as pq  # noqa: PLC0415
+
+        if not isinstance(data, pa.Table):
+            data = (
+                data.to_pyarrow()
+                if hasattr(data, "to_pyarrow")
+                else pa.Table.from_pandas(data)
+            )
+        pq.write_table(data, path)
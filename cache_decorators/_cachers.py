@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import logging
+import os
+import shutil
+import tempfile
+import threading
 from abc import ABC, abstractmethod
-from functools import wraps
+from collections import OrderedDict
+from contextlib import nullcontext
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 from public import public
 
@@ -16,19 +22,20 @@ from ._cache_protocols import (
     ReadWriteParquet,
     UpdateDecider,
 )
-from ._files import get_filelock, hide_file
-from ._hashing import hash_func, hash_str
-from ._inspection import bind_to_kwargs
+from ._files import get_filelock, get_threadlock, hide_file
+from ._hashing import hash_call
+from ._inspection import make_binder
 
 if TYPE_CHECKING:
     from collections.abc import Callable
     from contextlib import AbstractContextManager
-    from typing import Any, ParamSpec, TypeVar
+    from typing import Any, Literal, ParamSpec
 
     from ibis.expr.types import Table
 
     P = ParamSpec("P")
     R = TypeVar("R")
+    LockMode = Literal["process", "thread", "none"]
 
 
 _LOGGER = logging.getLogger("cache_decorators")
@@ -36,46 +43,71 @@ _DEFAULT_DIR = (Path.cwd() / ".cache").resolve()
 public(_DEFAULT_DIR=_DEFAULT_DIR)
 _FORCE_UPDATE = False
 public(_FORCE_UPDATE=_FORCE_UPDATE)
+_LOCK_MODES = ("process", "thread", "none")
+# Most tables kept per FileCacher with reuse_tables, least recently read go first
+_MAX_TABLES = 64
+ResourceT = TypeVar("ResourceT")
+
+
+@lru_cache
+def _validated_dir(cache_dir: str) -> Path:
+    try:
+        # A strict resolve fails on a missing dir, no separate exists check needed
+        path = Path(cache_dir).resolve(strict=True)
+    except FileNotFoundError:
+        path = Path(cache_dir).resolve()
+        # New dirs are made under their hidden name, no rename needed, and a dir
+        # hidden by an earlier run is picked up instead of clashing with it
+        if not path.name.startswith("."):
+            path = path.parent / ("." + path.name)
+        _LOGGER.debug("Making and hiding cache dir '%s'", path)
+        path.mkdir(parents=True, exist_ok=True)
+        path = hide_file(path)
+    return path
 
 
 @public
-class Cacher(ABC):
+class Cacher(ABC, Generic[ResourceT]):
+    __slots__ = ("_fast_key", "_processor", "_should_update")
+
     def __init__(
         self,
-        decider: UpdateDecider,
+        decider: UpdateDecider[ResourceT],
         processor: Processor | None = None,
+        *,
+        fast_key: bool = False,
     ) -> None:
         self._should_update = decider
         self._processor = processor
+        self._fast_key = fast_key
 
     def __call__(
         self,
         func: Callable[P, R],  # type:ignore[reportInvalidTypeVarUse]
     ) -> Callable[P, Table]:
+        binder = make_binder(func)
+
         def uncache(*args: P.args, **kwargs: P.kwargs) -> None:
-            self._do_uncache(func, *args, **kwargs)
+            self._do_uncache(func, binder, *args, **kwargs)
 
         @wraps(func)
         def decorated(*args: P.args, **kwargs: P.kwargs) -> Table:
-            return self._do_cache(func, *args, **kwargs)
+            return self._do_cache(func, binder, *args, **kwargs)
 
         decorated.__setattr__("uncache", uncache)
         return decorated
 
-    def _preprocess(self, data) -> Any:  # noqa: ANN001, ANN401
-        if not self._processor:
-            return data
-        return self._processor.preprocess(data)
-
-    def _postprocess(self, tbl: Table) -> Table:
-        if not self._processor:
-            return tbl
-        return self._processor.postprocess(tbl)
+    @abstractmethod
+    def _resource_from_id(
+        self,
+        r_id: str,
+    ) -> ResourceT:
+        raise NotImplementedError
 
     @abstractmethod
     def _resource_context(
         self,
-        r_id: str,
+        resource: ResourceT,
         timeout: float = -1,
     ) -> AbstractContextManager:
         raise NotImplementedError
@@ -90,110 +122,179 @@ class Cacher(ABC):
     @abstractmethod
     def _uncache_resource(
         self,
-        r_id: str,
+        resource: ResourceT,
     ) -> None:
         raise NotImplementedError
 
     @abstractmethod
     def _read_cache(
         self,
-        r_id: str,
+        resource: ResourceT,
     ) -> Table:
         raise NotImplementedError
 
     @abstractmethod
     def _write_cache(
         self,
-        r_id: str,
+        resource: ResourceT,
         data,  # noqa: ANN001
     ) -> None:
         raise NotImplementedError
 
+    def _resource_and_kwargs(
+        self,
+        func: Callable[P, R],  # type:ignore[reportInvalidTypeVarUse]
+        binder: Callable[P, dict[str, Any]],
+        /,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> tuple[ResourceT, dict[str, Any]]:
+        # Fast keys skip binding, so deciders only see arguments passed by keyword
+        if self._fast_key:
+            r_id = hash_call(func, kwargs, args)
+            return self._resource_from_id(r_id), kwargs
+        bound_kwargs = binder(*args, **kwargs)
+        return self._resource_from_id(hash_call(func, bound_kwargs)), bound_kwargs
+
     def _do_cache(
         self,
         func: Callable[P, R],  # type:ignore[reportInvalidTypeVarUse]
+        binder: Callable[P, dict[str, Any]],
+        /,
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> Table:
-        bound_kwargs = bind_to_kwargs(
+        resource, decider_kwargs = self._resource_and_kwargs(
             func,
+            binder,
             *args,
             **kwargs,
         )
-        r_id = hash_str(repr({"*func*": hash_func(func)} | bound_kwargs))
-        with self._resource_context(r_id):
-            if _FORCE_UPDATE or self._should_update(r_id, **bound_kwargs):
-                data = self._preprocess(
-                    func(**bound_kwargs),  # type:ignore[reportGeneralTypeIssues]
-                )
-                self._write_cache(r_id, data)
-            return self._postprocess(self._read_cache(r_id))
+        processor = self._processor
+        # Cache hits are served without taking the resource lock
+        if not _FORCE_UPDATE and not self._should_update(resource, **decider_kwargs):
+            try:
+                tbl = self._read_cache(resource)
+            except FileNotFoundError:
+                # Uncached since the check, recheck and recompute under the lock
+                pass
+            else:
+                return tbl if processor is None else processor.postprocess(tbl)
+        with self._resource_context(resource):
+            # Re-check under the lock, another caller may have just written it
+            if _FORCE_UPDATE or self._should_update(resource, **decider_kwargs):
+                data = func(*args, **kwargs)
+                if processor is not None:
+                    data = processor.preprocess(data)
+                self._write_cache(resource, data)
+            tbl = self._read_cache(resource)
+            return tbl if processor is None else processor.postprocess(tbl)
 
     def _do_uncache(
         self,
         func: Callable[P, R],  # type:ignore[reportInvalidTypeVarUse]
+        binder: Callable[P, dict[str, Any]],
+        /,
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> None:
-        bound_kwargs = bind_to_kwargs(
-            func,
-            *args,
-            **kwargs,
-        )
-        r_id = hash_str(repr({"*func*": hash_func(func)} | bound_kwargs))
-        with self._resource_context(r_id):
-            self._uncache_resource(r_id)
+        resource, _ = self._resource_and_kwargs(func, binder, *args, **kwargs)
+        with self._resource_context(resource):
+            self._uncache_resource(resource)
 
 
 @public
-class FileCacher(Cacher):
-    def __init__(
+class FileCacher(Cacher[Path]):
+    __slots__ = ("_cache_dir", "_lock_mode", "_read_write", "_tables", "_tables_lock")
+
+    def __init__(  # noqa: PLR0913
         self,
         cache_dir: Path | str | None = None,
         read_write: FileReadWrite | None = None,
         update_decider: FileUpdateDecider | None = None,
         processor: Processor | None = None,
+        *,
+        lock_mode: LockMode = "process",
+        fast_key: bool = False,
+        reuse_tables: bool = False,
     ) -> None:
+        if lock_mode not in _LOCK_MODES:
+            msg = f"lock_mode must be one of {_LOCK_MODES}, got {lock_mode!r}"
+            raise ValueError(msg)
+        self._lock_mode = lock_mode
+        # Tables already read from a cache file, keyed by path with the file's mtime
+        self._tables: OrderedDict[Path, tuple[int, Table]] | None = (
+            OrderedDict() if reuse_tables else None
+        )
+        # Hits read without the resource lock, the map is guarded on its own
+        self._tables_lock = threading.Lock()
         self._cache_dir: Path = self._validate_cache_dir(cache_dir)
         self._read_write: FileReadWrite = (
             read_write if read_write is not None else ReadWriteParquet()
         )
-        decider = self._wrap_decider(
+        super().__init__(
             (update_decider if update_decider is not None else FileTimeoutDecider()),
+            processor,
+            fast_key=fast_key,
         )
-        super().__init__(decider, processor)
 
     def _validate_cache_dir(self, cache_dir: Path | str | None) -> Path:
-        cache_dir = Path(cache_dir).resolve() if cache_dir else _DEFAULT_DIR
-        if not cache_dir.exists():
-            _LOGGER.debug("Making and hiding cache dir '%s'", cache_dir)
-            cache_dir.mkdir(parents=True)
-            cache_dir = hide_file(cache_dir)
-        return cache_dir
-
-    def _wrap_decider(self, fud: FileUpdateDecider) -> UpdateDecider:
-        def wrapper(r_id: str, **kwargs) -> bool:  # noqa: ANN003
-            target_file = self._path_from_resource_id(r_id)
-            return fud(target_file, **kwargs)
-
-        return wrapper
+        # Validated once per absolute path, cachers sharing a dir skip the stat
+        return _validated_dir(
+            os.path.abspath(cache_dir) if cache_dir else str(_DEFAULT_DIR),  # noqa: PTH100
+        )
 
-    def _path_from_resource_id(self, r_id: str) -> Path:
+    def _resource_from_id(self, r_id: str) -> Path:
         return self._cache_dir / f"{r_id}{self._read_write.file_extension}"
 
     def _resource_context(
         self,
-        r_id: str,
+        target_file: Path,
         timeout: float = -1,
     ) -> AbstractContextManager:
-        target_file = self._path_from_resource_id(r_id)
+        if self._lock_mode == "thread":
+            return get_threadlock(target_file, timeout)
+        if self._lock_mode == "none":
+            return nullcontext()
         return get_filelock(target_file, timeout)
 
-    def _read_cache(self, r_id: str) -> Table:
-        return self._read_write.read_file(self._path_from_resource_id(r_id))
-
-    def _write_cache(self, r_id: str, data) -> None:  # noqa: ANN001
-        return self._read_write.write_file(self._path_from_resource_id(r_id), data)
-
-    def _uncache_resource(self, r_id: str) -> None:
-        self._path_from_resource_id(r_id).unlink()
+    def _read_cache(self, target_file: Path) -> Table:
+        # Readers raise their own errors for missing files, a vanished cache file is
+        # surfaced as FileNotFoundError for the unlocked read to fall back on
+        m_time = target_file.stat().st_mtime_ns
+        if self._tables is None:
+            return self._read_write.read_file(target_file)
+        with self._tables_lock:
+            cached = self._tables.get(target_file)
+            if cached is not None and cached[0] == m_time:
+                self._tables.move_to_end(target_file)
+                return cached[1]
+        tbl = self._read_write.read_file(target_file)
+        with self._tables_lock:
+            self._tables[target_file] = (m_time, tbl)
+            self._tables.move_to_end(target_file)
+            if len(self._tables) > _MAX_TABLES:
+                self._tables.popitem(last=False)
+        return tbl
+
+    def _drop_table(self, target_file: Path) -> None:
+        if self._tables is not None:
+            with self._tables_lock:
+                self._tables.pop(target_file, None)
+
+    def _write_cache(self, target_file: Path, data) -> None:  # noqa: ANN001
+        self._drop_table(target_file)
+        # The dir is only validated once per process, it may have been removed since
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        # Written aside and moved into place, unlocked readers never see a partial file
+        tmp_dir = Path(tempfile.mkdtemp(dir=self._cache_dir))
+        try:
+            tmp_file = tmp_dir / target_file.name
+            self._read_write.write_file(tmp_file, data)
+            tmp_file.replace(target_file)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _uncache_resource(self, target_file: Path) -> None:
+        self._drop_table(target_file)
+        target_file.unlink()
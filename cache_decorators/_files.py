@@ -1,80 +1,93 @@
 from __future__ import annotations
 
-import os
 import sys
-from datetime import datetime, timezone
-from errno import ENOENT
+import threading
+import time
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Protocol
+from weakref import WeakValueDictionary
 
-from filelock import FileLock
+from filelock import FileLock, Timeout
 
 if TYPE_CHECKING:
-    from datetime import timedelta
+    from collections.abc import Iterator
     from pathlib import Path
 
 if sys.platform == "win32":
     from ctypes import WinError, windll
     from stat import FILE_ATTRIBUTE_HIDDEN
 
-    def win_file_hidden(path: Path) -> bool:
-        attr = path.stat().st_file_attributes
-        return attr & FILE_ATTRIBUTE_HIDDEN == FILE_ATTRIBUTE_HIDDEN
+    def win_file_hidden(attributes: int) -> bool:
+        return attributes & FILE_ATTRIBUTE_HIDDEN == FILE_ATTRIBUTE_HIDDEN
 
-    def win_hide_file(path: Path) -> None:
+    def win_hide_file(path_str: str, attributes: int) -> None:
         # SetFileAttributesW returns False when an error occurs
         if not windll.kernel32.SetFileAttributesW(
-            str(path.resolve()),
-            FILE_ATTRIBUTE_HIDDEN,
+            path_str,
+            attributes | FILE_ATTRIBUTE_HIDDEN,
         ):
             raise WinError()
 
 
 def hide_file(path: Path) -> Path:
-    path = path.resolve()
-    if not path.exists():
-        raise FileNotFoundError(ENOENT, os.strerror(ENOENT), str(path))
-
-    # UNIX like systems hide files that begin with "."
+    # UNIX like systems hide files that begin with ".", already hidden paths skip
+    # resolving and renaming entirely
     if not path.name.startswith("."):
+        path = path.resolve()
         new_path = path.parent / ("." + path.name)
         path = path.rename(new_path)
 
-    # Set file attributes on win machines
-    if sys.platform == "win32" and not win_file_hidden(path):
-        win_hide_file(path)
+    # Set file attributes on win machines, reusing the path and attributes at hand
+    if sys.platform == "win32":
+        attributes = path.stat().st_file_attributes
+        if not win_file_hidden(attributes):
+            win_hide_file(str(path), attributes)
 
     return path
 
 
-class PathTimeDelta(Protocol):
-    def __call__(self, path: Path) -> timedelta: ...
+class PathAge(Protocol):
+    def __call__(self, path: Path) -> float: ...
 
 
-def t_since_last_mod(path: Path) -> timedelta:
-    m_time = datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
-    cur_time = datetime.now(tz=timezone.utc)
-    return cur_time - m_time
+def secs_since_last_mod(path: Path) -> float:
+    return time.time() - path.stat().st_mtime
 
 
-def t_since_last_access(path: Path) -> timedelta:
-    a_time = datetime.fromtimestamp(path.stat().st_atime, tz=timezone.utc)
-    cur_time = datetime.now(tz=timezone.utc)
-    return cur_time - a_time
+def secs_since_last_access(path: Path) -> float:
+    return time.time() - path.stat().st_atime
 
 
 def file_past_timeout(
     path: Path,
     timeout: int,
-    delta_func: PathTimeDelta = t_since_last_mod,
+    delta_func: PathAge = secs_since_last_mod,
 ) -> bool:
-    if not path.exists():
-        return True
     if timeout < 0:
-        return False
-    elapsed = delta_func(path).seconds
-    return elapsed > timeout
+        return not path.exists()
+    try:
+        return delta_func(path) > timeout
+    except FileNotFoundError:
+        return True
 
 
 def get_filelock(target_file: Path, timeout: float = -1) -> FileLock:
     lock_file = target_file.parent / (target_file.name + ".lock")
     return FileLock(lock_file=lock_file, timeout=timeout)
+
+
+_THREAD_LOCKS: WeakValueDictionary[str, threading.Lock] = WeakValueDictionary()
+_THREAD_LOCKS_GUARD = threading.Lock()
+
+
+@contextmanager
+def get_threadlock(target_file: Path, timeout: float = -1) -> Iterator[None]:
+    # Only excludes threads of this process, use get_filelock across processes
+    with _THREAD_LOCKS_GUARD:
+        lock = _THREAD_LOCKS.setdefault(str(target_file), threading.Lock())
+    if not lock.acquire(timeout=timeout):
+        raise Timeout(str(target_file))
+    try:
+        yield
+    finally:
+        lock.release()
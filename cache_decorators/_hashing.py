@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import hashlib
 import inspect
-from functools import lru_cache
+import re
+import weakref
+from functools import lru_cache, partial
+from types import CodeType
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from hashlib import _Hash
-    from typing import Callable
+    from typing import Any, Callable
 
     from _typeshed import ReadableBuffer
 
@@ -21,11 +25,163 @@ class HashingProtocol(Protocol):
     ) -> _Hash: ...
 
 
-def hash_str(string: str, hasher: HashingProtocol = hashlib.sha256) -> str:
-    return hasher(string.encode("utf-8"), usedforsecurity=False).hexdigest()
+# Hashes only name cache files, so a 128 bit BLAKE2b digest is plenty and is
+# considerably cheaper than SHA-256. Custom hashers need only match HashingProtocol.
+_DEFAULT_HASHER: HashingProtocol = partial(hashlib.blake2b, digest_size=16)
 
 
-@lru_cache
-def hash_func(func: Callable, hasher: HashingProtocol = hashlib.sha256) -> str:
-    src = inspect.getsource(func)
-    return hasher(src.encode("utf-8"), usedforsecurity=False).hexdigest()
+def hash_str(string: str, hasher: HashingProtocol = _DEFAULT_HASHER) -> str:
+    # surrogatepass keeps lone surrogates hashable instead of raising
+    data = string.encode("utf-8", errors="surrogatepass")
+    return hasher(data, usedforsecurity=False).hexdigest()
+
+
+def _code_payload(code: CodeType) -> Iterator[bytes]:
+    yield code.co_code
+    # Parameter names, results are cached on bound argument names
+    n_params = code.co_argcount + code.co_kwonlyargcount
+    n_params += bool(code.co_flags & inspect.CO_VARARGS)
+    n_params += bool(code.co_flags & inspect.CO_VARKEYWORDS)
+    yield repr(
+        (
+            code.co_varnames[:n_params],
+            code.co_argcount,
+            code.co_posonlyargcount,
+            code.co_kwonlyargcount,
+            code.co_flags,
+        ),
+    ).encode("utf-8")
+    for const in code.co_consts:
+        # Nested code objects repr with their memory address, and frozenset
+        # iteration order depends on the hash seed, neither is stable across runs
+        if isinstance(const, CodeType):
+            yield from _code_payload(const)
+        elif isinstance(const, frozenset):
+            yield repr(sorted(const, key=repr)).encode("utf-8")
+        else:
+            yield repr(const).encode("utf-8")
+    yield repr((code.co_names, code.co_freevars)).encode("utf-8")
+
+
+_CODE_PAYLOADS: weakref.WeakKeyDictionary[CodeType, bytes] = weakref.WeakKeyDictionary()
+
+
+_ADDRESS_REPR = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def _value_payload(value: object) -> str:
+    # Defaults and partial arguments, reduced to a form that is stable across runs
+    if isinstance(value, (tuple, list)):
+        return f"{type(value).__name__}({', '.join(map(_value_payload, value))})"
+    if isinstance(value, (set, frozenset)):
+        return f"{type(value).__name__}({sorted(map(_value_payload, value))})"
+    if isinstance(value, dict):
+        items = (f"{_value_payload(k)}: {_value_payload(v)}" for k, v in value.items())
+        return f"{{{', '.join(items)}}}"
+    if callable(value):
+        try:
+            return hash_func(value)
+        except TypeError:
+            pass
+    value_repr = repr(value)
+    if _ADDRESS_REPR.search(value_repr):
+        # Sentinels and other reprs holding a memory address, only the type is stable
+        value_type = type(value)
+        return f"<{value_type.__module__}.{value_type.__qualname__}>"
+    return value_repr
+
+
+def _func_payload(func: Callable) -> Iterator[bytes]:
+    if isinstance(func, partial):
+        yield from _func_payload(func.func)
+        yield _value_payload((func.args, func.keywords)).encode("utf-8")
+        return
+
+    # Decorated functions change with the function they wrap, not just the wrapper
+    wrapped = getattr(func, "__wrapped__", None)
+    if wrapped is not None:
+        yield from _func_payload(wrapped)
+
+    code = getattr(func, "__code__", None)
+    if not isinstance(code, CodeType):
+        name = getattr(func, "__qualname__", None)
+        if name is not None:
+            # Builtins and classes are identified by name
+            yield f"{getattr(func, '__module__', None)}.{name}".encode()
+            return
+        # Callable instances by their class and its __call__, not their state
+        func_type = type(func)
+        if not isinstance(getattr(func_type.__call__, "__code__", None), CodeType):
+            msg = f"Cannot hash callable {func!r}"
+            raise TypeError(msg)
+        yield f"{func_type.__module__}.{func_type.__qualname__}".encode()
+        yield from _func_payload(func_type.__call__)
+        return
+
+    # Functions made by the same def (closures, factories) share their code object
+    code_payload = _CODE_PAYLOADS.get(code)
+    if code_payload is None:
+        code_payload = _CODE_PAYLOADS[code] = b"\x00".join(_code_payload(code))
+    yield code_payload
+    yield repr((func.__module__, func.__qualname__)).encode("utf-8")
+    yield _value_payload((func.__defaults__, func.__kwdefaults__)).encode("utf-8")
+
+
+# Keyed on id() rather than the function itself, entries are dropped by a finalizer
+# when the function is collected instead of being pinned like with lru_cache
+_FUNC_HASHES: dict[tuple[int, HashingProtocol], str] = {}
+
+
+def hash_func(func: Callable, hasher: HashingProtocol = _DEFAULT_HASHER) -> str:
+    key = (id(func), hasher)
+    func_hash = _FUNC_HASHES.get(key)
+    if func_hash is not None:
+        return func_hash
+
+    payload = b"\x00".join(_func_payload(func))
+    func_hash = hasher(payload, usedforsecurity=False).hexdigest()
+    try:
+        weakref.finalize(func, _FUNC_HASHES.pop, key, None)
+    except TypeError:
+        # Not weak referenceable (builtins), these are cheap to hash anyway
+        return func_hash
+    _FUNC_HASHES[key] = func_hash
+    return func_hash
+
+
+# Values of these types are used as-is in the resource id cache key, everything else
+# is reduced to its ``repr``. The type is kept alongside the value so that keys for
+# equal-but-distinct values (``1``, ``True``) do not collide.
+_PLAIN_TYPES = frozenset({str, bytes, int, bool, type(None)})
+
+
+def _kwargs_key(bound_kwargs: dict[str, Any]) -> tuple:
+    return tuple(
+        sorted(
+            (k, type(v), v) if type(v) in _PLAIN_TYPES else (k, None, repr(v))
+            for k, v in bound_kwargs.items()
+        ),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _rid_cached(func_hash: str, kwargs_key: tuple) -> str:
+    hasher = _DEFAULT_HASHER(func_hash.encode("utf-8"), usedforsecurity=False)
+    for key, value_type, value in kwargs_key:
+        if value_type is None:
+            entry = f"\x00{key}\x00:{value}"
+        else:
+            entry = f"\x00{key}\x00{value_type.__name__}:{value!r}"
+        hasher.update(entry.encode("utf-8", errors="surrogatepass"))
+    return hasher.hexdigest()
+
+
+def hash_call(
+    func: Callable,
+    bound_kwargs: dict[str, Any],
+    args: tuple = (),
+) -> str:
+    kwargs_key = _kwargs_key(bound_kwargs)
+    if args:
+        kwargs_key = (("*args*", None, repr(args)), *kwargs_key)
+    return _rid_cached(hash_func(func), kwargs_key)
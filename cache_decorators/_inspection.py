@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import inspect
 import logging
-from functools import lru_cache
+from functools import partial
 from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
     from typing import Any, Callable, ParamSpec
@@ -13,19 +14,100 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger("cache_decorators")
 
 
-@lru_cache
+_SIGNATURES: WeakKeyDictionary[Callable, inspect.Signature] = WeakKeyDictionary()
+
+
+def _signature(func: Callable) -> inspect.Signature:
+    try:
+        return _SIGNATURES[func]
+    except KeyError:
+        sig = _SIGNATURES[func] = inspect.signature(func)
+        return sig
+    except TypeError:
+        # Not weak referenceable (builtins)
+        return inspect.signature(func)
+
+
 def bind_to_kwargs(
     func: Callable[P, Any],
+    /,
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> dict[str, Any]:
-    kw_out = inspect.signature(func).bind(*args, **kwargs).arguments | kwargs
-    _LOGGER.debug(
-        "Bound '%s'(*%s,**%s) to '%s'(%s)",
-        func.__name__,
-        args,
-        kwargs,
-        func.__name__,
-        kw_out,
-    )
+    # Keyword arguments are already named, only positionals need the signature.
+    # Invalid calls are left for the function itself to reject.
+    if not args:
+        kw_out = dict(kwargs)
+    else:
+        # `arguments` is a fresh dict per bind, update it rather than copying
+        kw_out = _signature(func).bind_partial(*args).arguments
+        kw_out.update(kwargs)
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Bound '%s'(*%s,**%s) to '%s'(%s)",
+            func.__name__,
+            args,
+            kwargs,
+            func.__name__,
+            kw_out,
+        )
     return kw_out
+
+
+_MISSING = object()
+_SIMPLE_KINDS = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    inspect.Parameter.KEYWORD_ONLY,
+)
+
+
+def _binder_param(param: inspect.Parameter) -> str:
+    if param.default is inspect.Parameter.empty:
+        return param.name
+    return f"{param.name}=__missing__"
+
+
+def make_binder(func: Callable[P, Any]) -> Callable[P, dict[str, Any]]:
+    # Compiles a binder equivalent to `bind_to_kwargs` for fixed signatures, so no
+    # `inspect` machinery runs per call. `*args`/`**kwargs` fall back to binding.
+    try:
+        params = list(_signature(func).parameters.values())
+    except (TypeError, ValueError):
+        return partial(bind_to_kwargs, func)
+    names = {p.name for p in params}
+    if (
+        any(p.kind not in _SIMPLE_KINDS for p in params)
+        or "__missing__" in names
+        or "__bound__" in names
+    ):
+        return partial(bind_to_kwargs, func)
+
+    kind = inspect.Parameter
+    sig_parts = [_binder_param(p) for p in params if p.kind == kind.POSITIONAL_ONLY]
+    if sig_parts:
+        sig_parts.append("/")
+    sig_parts += [
+        _binder_param(p) for p in params if p.kind == kind.POSITIONAL_OR_KEYWORD
+    ]
+    kw_only = [_binder_param(p) for p in params if p.kind == kind.KEYWORD_ONLY]
+    if kw_only:
+        sig_parts += ["*", *kw_only]
+
+    body = ["    __bound__ = {}"]
+    for param in params:
+        assign = f"__bound__[{param.name!r}] = {param.name}"
+        if param.default is inspect.Parameter.empty:
+            body.append(f"    {assign}")
+        else:
+            body.append(f"    if {param.name} is not __missing__: {assign}")
+    body.append("    return __bound__")
+
+    src = f"def binder({', '.join(sig_parts)}):\n" + "\n".join(body)
+    namespace: dict[str, Any] = {"__missing__": _MISSING}
+    exec(src, namespace)  # noqa: S102
+    binder = namespace["binder"]
+    # Invalid calls then raise TypeErrors naming the decorated function
+    binder.__name__ = getattr(func, "__name__", binder.__name__)
+    binder.__qualname__ = getattr(func, "__qualname__", binder.__qualname__)
+    return binder
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import ibis
+import pandas as pd
+import pyarrow as pa
+import pytest
+from cache_decorators import ReadWriteArrowParquet
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_DATA = {"a": [1, 2, 3], "b": ["x", "y", "z"]}
+
+
+@pytest.mark.parametrize(
+    "data",
+    [pd.DataFrame(_DATA), pa.table(_DATA), ibis.memtable(_DATA)],
+    ids=["pandas", "pyarrow", "ibis"],
+)
+def test_read_write_arrow_parquet(tmp_path: Path, data: object) -> None:
+    read_write = ReadWriteArrowParquet()
+    path = tmp_path / f"data{read_write.file_extension}"
+    read_write.write_file(path, data)
+    tbl = read_write.read_file(path)
+    assert isinstance(tbl, pa.Table)
+    assert tbl.select(list(_DATA)).to_pydict() == _DATA
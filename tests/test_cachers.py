@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+import time
+from typing import TYPE_CHECKING, ClassVar
+
+import pandas as pd
+import pytest
+from cache_decorators import (
+    FileCacher,
+    FileComparisonDecider,
+    ReadWriteParquet,
+    _cachers,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class ReadWriteText:
+    file_extension: ClassVar[str] = ".txt"
+
+    def read_file(self, path: Path) -> str:
+        return path.read_text()
+
+    def write_file(self, path: Path, data: str) -> None:
+        path.write_text(data)
+
+
+class CountingReadWriteText(ReadWriteText):
+    def __init__(self) -> None:
+        self.reads = 0
+
+    def read_file(self, path: Path) -> str:
+        self.reads += 1
+        return super().read_file(path)
+
+
+class SlowReadWriteText(ReadWriteText):
+    def __init__(self) -> None:
+        self.started = threading.Event()
+
+    def write_file(self, path: Path, data: str) -> None:
+        with path.open("w") as file:
+            file.write(data[:3])
+            file.flush()
+            self.started.set()
+            time.sleep(0.2)
+            file.write(data[3:])
+
+
+def test_concurrent_hit_waits_for_write(tmp_path: Path) -> None:
+    read_write = SlowReadWriteText()
+    calls = []
+
+    @FileCacher(tmp_path / ".cache", read_write, lock_mode="thread")
+    def func() -> str:
+        calls.append(None)
+        return "abcdef"
+
+    results = []
+    writer = threading.Thread(target=lambda: results.append(func()))
+    writer.start()
+    read_write.started.wait()
+    results.append(func())
+    writer.join()
+    assert results == ["abcdef", "abcdef"]
+    assert len(calls) == 1
+    # No temporary files are left behind next to the cache file
+    assert [p.suffix for p in (tmp_path / ".cache").iterdir()] == [".txt"]
+
+
+def test_uncached_after_check(tmp_path: Path) -> None:
+    # The first check sees a fresh file that is gone by the time it is read
+    decisions = iter([False, True])
+
+    @FileCacher(
+        tmp_path / ".cache",
+        SlowReadWriteText(),
+        lambda _, **__: next(decisions),
+        lock_mode="none",
+    )
+    def func() -> str:
+        return "abcdef"
+
+    assert func() == "abcdef"
+
+
+def test_uncached_after_check_parquet(tmp_path: Path) -> None:
+    # The default reader raises its own error for missing files
+    decisions = iter([False, True])
+
+    @FileCacher(
+        tmp_path / ".cache",
+        ReadWriteParquet(),
+        lambda _, **__: next(decisions),
+        lock_mode="none",
+    )
+    def func() -> pd.DataFrame:
+        return pd.DataFrame({"a": [1, 2]})
+
+    assert func().to_pandas()["a"].tolist() == [1, 2]
+
+
+@pytest.mark.parametrize("lock_mode", ["process", "thread", "none"])
+def test_lock_mode(tmp_path: Path, lock_mode: str) -> None:
+    cacher = FileCacher(tmp_path / ".cache", lock_mode=lock_mode)  # type:ignore[arg-type]
+    target_file = tmp_path / ".cache" / "file"
+    with cacher._resource_context(target_file):  # noqa: SLF001
+        # Only the process lock is backed by a lock file
+        assert target_file.with_suffix(".lock").exists() == (lock_mode == "process")
+
+
+def test_lock_mode_invalid(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="lock_mode"):
+        FileCacher(tmp_path / ".cache", lock_mode="file")  # type:ignore[arg-type]
+
+
+def test_cache_dir_removed(tmp_path: Path) -> None:
+    cache_dir = tmp_path / ".cache"
+
+    @FileCacher(cache_dir, ReadWriteText(), lock_mode="none")
+    def func(x: int) -> str:
+        return "abcdef" * x
+
+    assert func(1) == "abcdef"
+    shutil.rmtree(cache_dir)
+    assert func(2) == "abcdefabcdef"
+
+
+def test_fast_key(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    bound = []
+
+    def binder(*args: object, **kwargs: object) -> dict:
+        bound.append((args, kwargs))
+        return kwargs
+
+    monkeypatch.setattr(_cachers, "make_binder", lambda _: binder)
+    calls = []
+
+    @FileCacher(tmp_path / ".cache", ReadWriteText(), fast_key=True)
+    def func(x: int) -> str:
+        calls.append(x)
+        return str(x)
+
+    assert [func(1), func(x=1), func(1), func(x=1)] == ["1", "1", "1", "1"]
+    assert calls == [1, 1]
+    assert bound == []
+    assert len(list((tmp_path / ".cache").glob("*.txt"))) == 2
+
+
+def test_fast_key_comparison_positional(tmp_path: Path) -> None:
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("abc")
+
+    @FileCacher(
+        tmp_path / ".cache",
+        ReadWriteText(),
+        FileComparisonDecider("path"),
+        fast_key=True,
+    )
+    def func(path: Path) -> str:
+        return path.read_text()
+
+    assert func(path=input_file) == "abc"
+    with pytest.raises(TypeError, match="passed positionally"):
+        func(input_file)
+
+
+def test_comparison_default(tmp_path: Path) -> None:
+    @FileCacher(tmp_path / ".cache", ReadWriteText(), FileComparisonDecider("path"))
+    def func(path: Path = tmp_path) -> str:
+        return str(path)
+
+    with pytest.raises(TypeError, match="left at its default"):
+        func()
+
+
+def test_reuse_tables(tmp_path: Path) -> None:
+    read_write = CountingReadWriteText()
+    cacher = FileCacher(tmp_path / ".cache", read_write, reuse_tables=True)
+
+    @cacher
+    def func(x: int) -> str:
+        return str(x)
+
+    # Unchanged files are read once
+    assert [func(1), func(1), func(1)] == ["1", "1", "1"]
+    assert read_write.reads == 1
+
+    # Files changed outside the cacher are read again
+    (target_file,) = (tmp_path / ".cache").glob("*.txt")
+    m_time = target_file.stat().st_mtime + 10
+    os.utime(target_file, (m_time, m_time))
+    assert func(1) == "1"
+    assert read_write.reads == 2
+
+    # Writing or uncaching a file drops its table
+    func.uncache(1)  # type:ignore[attr-defined]
+    assert target_file not in cacher._tables  # noqa: SLF001
+    assert func(1) == "1"
+    assert read_write.reads == 3
+    cacher._write_cache(target_file, "2")  # noqa: SLF001
+    assert target_file not in cacher._tables  # noqa: SLF001
+    assert func(1) == "2"
+    assert read_write.reads == 4
+
+
+def test_reuse_tables_bounded(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(_cachers, "_MAX_TABLES", 2)
+    read_write = CountingReadWriteText()
+    cacher = FileCacher(tmp_path / ".cache", read_write, reuse_tables=True)
+
+    @cacher
+    def func(x: int) -> str:
+        return str(x)
+
+    assert [func(1), func(2), func(1), func(3)] == ["1", "2", "1", "3"]
+    assert len(cacher._tables) == 2  # noqa: SLF001
+    # 2 was least recently read and evicted, 1 is still kept
+    assert func(1) == "1"
+    assert read_write.reads == 3
+    assert func(2) == "2"
+    assert read_write.reads == 4
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+from cache_decorators import _files
+from filelock import Timeout
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize(
+    ("age", "timeout", "past"),
+    [
+        (0, -1, False),
+        (0, 10, False),
+        (20, 10, True),
+        (86400 + 5, 10, True),
+        (86400 + 5, -1, False),
+    ],
+)
+def test_file_past_timeout(tmp_path: Path, age: int, timeout: int, past: bool) -> None:
+    path = tmp_path / "file"
+    path.touch()
+    m_time = time.time() - age
+    os.utime(path, (m_time, m_time))
+    assert _files.file_past_timeout(path, timeout) == past
+
+
+@pytest.mark.parametrize("timeout", [-1, 0, 10])
+def test_file_past_timeout_missing(tmp_path: Path, timeout: int) -> None:
+    assert _files.file_past_timeout(tmp_path / "missing", timeout)
+
+
+def test_get_threadlock_exclusive(tmp_path: Path) -> None:
+    path = tmp_path / "file"
+    active = []
+    overlaps = []
+
+    def work() -> None:
+        with _files.get_threadlock(path):
+            active.append(None)
+            overlaps.append(len(active) > 1)
+            time.sleep(0.01)
+            active.pop()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert overlaps == [False] * 8
+
+
+def test_get_threadlock_timeout(tmp_path: Path) -> None:
+    path = tmp_path / "file"
+    with _files.get_threadlock(path), pytest.raises(Timeout):  # noqa: SIM117
+        with _files.get_threadlock(path, 0.01):
+            pass
+    with _files.get_threadlock(path, 0.01):
+        pass
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import gc
 import hashlib
+import operator
+import subprocess
+import sys
+from functools import partial, wraps
 from typing import TYPE_CHECKING
 
 import pytest
 from cache_decorators import _hashing
 
 if TYPE_CHECKING:
+    from pathlib import Path
     from typing import Any, Callable, Generator
 
 
@@ -31,7 +37,7 @@ def test_hash_str_md5(string: str, str_hash: str) -> None:
     assert _hashing.hash_str(string, hashlib.md5) == str_hash
 
 
-def __function_generator() -> Generator[tuple[Callable, str], Any, None]:
+def __function_generator() -> Generator[Callable, Any, None]:
     def func_a() -> str:
         return "Hello, World!"
 
@@ -41,11 +47,155 @@ def __function_generator() -> Generator[tuple[Callable, str], Any, None]:
     def func_c(y: float) -> float:
         return y**y
 
-    yield func_a, "829296c6efc222f845bd6fb540da6851"
-    yield func_b, "76026ebc676138503ec041aed5a567a9"
-    yield func_c, "c6b418b17594deee285cdecc7fcd33b9"
+    yield func_a
+    yield func_b
+    yield func_c
+    yield lambda z: z in {"a", "b"}
 
 
-def test_hash_func_md5() -> None:
-    for func, md5_hash in __function_generator():
-        assert _hashing.hash_func(func, hashlib.md5) == md5_hash
+def test_hash_func_distinct_and_repeatable() -> None:
+    hashes = [_hashing.hash_func(func, hashlib.md5) for func in __function_generator()]
+    assert all(len(func_hash) == 32 for func_hash in hashes)
+    assert len(set(hashes)) == len(hashes)
+    assert hashes == [
+        _hashing.hash_func(func, hashlib.md5) for func in __function_generator()
+    ]
+
+
+_STABILITY_SCRIPT = """
+import json
+from functools import partial, wraps
+
+from cache_decorators._hashing import hash_func
+
+_SENTINEL = object()
+
+
+def load(path, parser=json.loads): ...
+def get(x, y=_SENTINEL, *, z=frozenset({"a", "b", "c"})): ...
+
+
+print(hash_func(load), hash_func(get), hash_func(partial(load, parser=_SENTINEL)))
+"""
+
+
+def test_hash_func_stable_across_runs(tmp_path: Path) -> None:
+    # Same process repeatability hides memory addresses and hash seeds in the payload
+    script = tmp_path / "script.py"
+    script.write_text(_STABILITY_SCRIPT)
+    hashes = [
+        subprocess.run(
+            [sys.executable, script],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        for _ in range(2)
+    ]
+    assert hashes[0] == hashes[1]
+
+
+def test_hash_func_defaults() -> None:
+    def make_func(default: int) -> Callable:
+        def func(x: int = default) -> int:
+            return x
+
+        return func
+
+    assert _hashing.hash_func(make_func(1)) == _hashing.hash_func(make_func(1))
+    assert _hashing.hash_func(make_func(1)) != _hashing.hash_func(make_func(2))
+
+
+def test_hash_func_params() -> None:
+    def func(a: int, b: int) -> int:
+        return a - b
+
+    func_hash = _hashing.hash_func(func)
+
+    def func(b: int, a: int) -> int:
+        return b - a
+
+    assert _hashing.hash_func(func) != func_hash
+
+
+def test_hash_func_wrapped() -> None:
+    def deco(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(x: int) -> int:
+            return func(x)
+
+        return wrapper
+
+    @deco
+    def func(x: int) -> int:
+        return x + 1
+
+    func_hash = _hashing.hash_func(func)
+
+    @deco
+    def func(x: int) -> int:
+        return x * 100
+
+    assert _hashing.hash_func(func) != func_hash
+
+
+def test_hash_func_partial() -> None:
+    assert _hashing.hash_func(partial(int, base=2)) != _hashing.hash_func(
+        partial(int, base=8),
+    )
+
+
+class CallableA:
+    def __call__(self) -> int:
+        return 1
+
+
+def test_hash_func_instance() -> None:
+    assert _hashing.hash_func(CallableA()) == _hashing.hash_func(CallableA())
+    assert _hashing.hash_func(CallableA()) != _hashing.hash_func(CallableA)
+    with pytest.raises(TypeError):
+        _hashing.hash_func(operator.itemgetter(1))
+
+
+def test_hash_call() -> None:
+    def func(x: object, y: object = None) -> None: ...
+
+    assert _hashing.hash_call(func, {"x": 1, "y": "a"}) == _hashing.hash_call(
+        func,
+        {"y": "a", "x": 1},
+    )
+    assert _hashing.hash_call(func, {"x": 1}) != _hashing.hash_call(func, {"x": True})
+    assert _hashing.hash_call(func, {"x": [1]}) == _hashing.hash_call(func, {"x": [1]})
+    assert _hashing.hash_call(func, {"x": "1"}) != _hashing.hash_call(func, {"x": 1})
+
+
+@pytest.mark.parametrize(
+    ("string", "str_hash"),
+    [
+        ("Hello, World!", "3895c59e4aeb0903396b5be3fbec69fe"),
+        ("I must not fear", "637b2382153e3aae8cd6d05f2f7e727f"),
+    ],
+)
+def test_hash_str_default(string: str, str_hash: str) -> None:
+    assert _hashing.hash_str(string) == str_hash
+
+
+def test_hash_func_memo() -> None:
+    def func() -> None: ...
+
+    key = (id(func), _hashing._DEFAULT_HASHER)  # noqa: SLF001
+    func_hash = _hashing.hash_func(func)
+    assert _hashing._FUNC_HASHES[key] == func_hash  # noqa: SLF001
+    assert _hashing.hash_func(func) == func_hash
+    del func
+    gc.collect()
+    assert key not in _hashing._FUNC_HASHES  # noqa: SLF001
+    assert _hashing.hash_func(len) == _hashing.hash_func(len)
+
+
+def test_hash_surrogates() -> None:
+    assert len(_hashing.hash_str("\ud800")) == 32
+
+    def func(**kwargs: object) -> None: ...
+
+    assert len(_hashing.hash_call(func, {"\ud800": "\udfff"})) == 32
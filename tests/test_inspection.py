@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from cache_decorators import _inspection
+
+if TYPE_CHECKING:
+    from typing import Any, Callable
+
+
+def func_a(x: int, y: int = 2, *, z: int, w: int = 3) -> None: ...
+def func_b(p: int, q: int = 1, /, r: int = 2) -> None: ...
+def func_c() -> None: ...
+def func_d(*, k: int) -> None: ...
+def func_e(x: int, *args: Any, **kwargs: Any) -> None: ...  # noqa: ANN401
+
+
+@pytest.mark.parametrize(
+    ("func", "args", "kwargs"),
+    [
+        (func_a, (1,), {"z": 5}),
+        (func_a, (1, 9), {"w": 0, "z": 5}),
+        (func_a, (), {"z": 2, "x": 1}),
+        (func_b, (1,), {}),
+        (func_b, (1, 2, 3), {}),
+        (func_b, (1,), {"r": 4}),
+        (func_c, (), {}),
+        (func_d, (), {"k": 1}),
+        (func_e, (1, 2), {"m": 3}),
+    ],
+)
+def test_make_binder(
+    func: Callable,
+    args: tuple,
+    kwargs: dict[str, Any],
+) -> None:
+    bound = _inspection.make_binder(func)(*args, **kwargs)
+    assert bound == _inspection.bind_to_kwargs(func, *args, **kwargs)
+
+
+@pytest.mark.parametrize(
+    ("func", "args", "kwargs"),
+    [
+        (func_a, (1,), {}),
+        (func_a, (1, 2, 3), {"z": 1}),
+        (func_a, (1,), {"z": 1, "q": 2}),
+        (func_b, (), {"p": 1}),
+        (func_c, (1,), {}),
+    ],
+)
+def test_make_binder_invalid(
+    func: Callable,
+    args: tuple,
+    kwargs: dict[str, Any],
+) -> None:
+    with pytest.raises(TypeError):
+        _inspection.make_binder(func)(*args, **kwargs)
+
+
+def test_make_binder_name() -> None:
+    with pytest.raises(TypeError, match=r"^func_a\(\) missing"):
+        _inspection.make_binder(func_a)(z=1)